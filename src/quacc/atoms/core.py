@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from hashlib import md5
+from hashlib import blake2b, md5
+from importlib.util import find_spec
 from logging import getLogger
 from typing import TYPE_CHECKING
 
 import numpy as np
 from ase.filters import Filter
 from ase.io.jsonio import encode
+from pymatgen.core.periodic_table import Element
 from pymatgen.io.ase import AseAtomsAdaptor
 
+has_xxhash = bool(find_spec("xxhash"))
+if has_xxhash:
+    from xxhash import xxh128
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from hashlib import _Hash
 
     from ase.atoms import Atoms
@@ -21,6 +28,8 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+_METAL_ZS = np.array(sorted(element.Z for element in Element if element.is_metal))
+
 
 def _encode_atoms(atoms: Atoms) -> _Hash:
     """
@@ -36,9 +45,8 @@ def _encode_atoms(atoms: Atoms) -> _Hash:
     _Hash
         Encoded Atoms object
     """
-    atoms = copy_atoms(atoms)
+    atoms = copy_atoms(atoms, copy_calc=False)
     atoms.info = {}
-    atoms.calc = None
     encoded_atoms = encode(atoms)
     # This is a hack to avoid int32/int64 and float32/float64 differences
     # between machines.
@@ -52,7 +60,78 @@ def _encode_atoms(atoms: Atoms) -> _Hash:
     return md5(encoded_atoms.encode("utf-8"), usedforsecurity=False)
 
 
-def get_atoms_id(atoms: Atoms) -> str:
+def _canonical_bytes(atoms: Atoms) -> Iterator[memoryview | bytes]:
+    """
+    Yield a canonical raw-bytes view of an Atoms object, suitable for feeding
+    a hash one chunk at a time. Dtypes are normalized so the result does not
+    depend on the platform. Arrays that are already C-contiguous and of the
+    canonical dtype are exposed through a memoryview rather than copied.
+    Note: The .info dict and calculator are excluded.
+
+    Parameters
+    ----------
+    atoms
+        Atoms object
+
+    Yields
+    ------
+    memoryview | bytes
+        Byte chunks describing the Atoms object
+    """
+
+    def _view(array: NDArray, dtype: type) -> memoryview:
+        return memoryview(np.ascontiguousarray(array, dtype=dtype))
+
+    yield _view(atoms.positions, np.float64)
+    yield _view(atoms.cell.array, np.float64)
+    yield _view(atoms.numbers, np.int32)
+    yield _view(atoms.pbc, np.uint8)
+
+    # Any other per-atom arrays, e.g. initial magmoms or charges. Non-numeric
+    # arrays (e.g. PDB residue names) can't be cast to float, so they are
+    # hashed from their own buffer or, for object arrays, their string form.
+    for key in sorted(atoms.arrays):
+        if key in ("positions", "numbers"):
+            continue
+        array = atoms.arrays[key]
+        yield key.encode("utf-8")
+        if array.dtype.kind in "biuf":
+            yield _view(array, np.float64)
+        elif array.dtype.kind == "O":
+            yield str(array.tolist()).encode("utf-8")
+        else:
+            yield array.dtype.str.encode("utf-8")
+            yield memoryview(np.ascontiguousarray(array))
+
+    if atoms.constraints:
+        yield encode([constraint.todict() for constraint in atoms.constraints]).encode(
+            "utf-8"
+        )
+
+
+def _hash_atoms(atoms: Atoms) -> _Hash:
+    """
+    Returns a fast, non-cryptographic hash of the Atoms object. Uses xxh128 if
+    `xxhash` is installed and falls back to a 128-bit blake2b otherwise. Note:
+    The .info dict and calculator is excluded.
+
+    Parameters
+    ----------
+    atoms
+        Atoms object
+
+    Returns
+    -------
+    _Hash
+        Hashed Atoms object
+    """
+    h = xxh128() if has_xxhash else blake2b(digest_size=16)
+    for chunk in _canonical_bytes(atoms):
+        h.update(chunk)
+    return h
+
+
+def get_atoms_id(atoms: Atoms, use_md5: bool = True) -> str:
     """
     Get a unique identifier for an Atoms object.
 
@@ -60,13 +139,20 @@ def get_atoms_id(atoms: Atoms) -> str:
     ----------
     atoms
         Atoms object
+    use_md5
+        If True, the identifier is the MD5 hash of the JSON-encoded Atoms object,
+        which is stable across quacc versions and is what gets stored in
+        `atoms.info["_id"]`. If False, a much faster hash over the raw array
+        buffers is used instead, which is better suited for in-memory caching.
 
     Returns
     -------
     str
         Unique identifier for the Atoms object in the form of a string
     """
-    return _encode_atoms(atoms).hexdigest()
+    return (
+        _encode_atoms(atoms).hexdigest() if use_md5 else _hash_atoms(atoms).hexdigest()
+    )
 
 
 def get_atoms_id_parsl(atoms: Atoms, output_ref: bool = False) -> bytes:  # noqa: ARG001
@@ -102,16 +188,10 @@ def check_is_metal(atoms: Atoms) -> bool:
     bool
         True if the structure is likely a metal; False otherwise
     """
-    struct = (
-        AseAtomsAdaptor().get_structure(atoms)
-        if atoms.pbc.any()
-        else AseAtomsAdaptor().get_molecule(atoms, charge_spin_check=False)
-    )
+    return bool(np.isin(atoms.numbers, _METAL_ZS).all())
 
-    return all(k.is_metal for k in struct.composition)
 
-
-def copy_atoms(atoms: Atoms) -> Atoms:
+def copy_atoms(atoms: Atoms, copy_calc: bool = True) -> Atoms:
     """
     Simple function to copy an atoms object to prevent mutability.
 
@@ -119,19 +199,27 @@ def copy_atoms(atoms: Atoms) -> Atoms:
     ----------
     atoms
         Atoms object
+    copy_calc
+        Whether to copy the attached calculator. If False, the calculator is
+        skipped during the copy (rather than being copied and then thrown
+        away) and the returned Atoms object has no calculator.
 
     Returns
     -------
     atoms
         Atoms object
     """
+    calc = atoms.calc
     try:
-        atoms = deepcopy(atoms)
+        atoms = deepcopy(atoms) if copy_calc else deepcopy(atoms, memo={id(calc): None})
     except Exception:
         # Needed because of ASE issue #1084
-        calc = atoms.calc
         atoms = atoms.copy()
-        atoms.calc = calc
+        if copy_calc:
+            atoms.calc = calc
+
+    if not copy_calc:
+        atoms.calc = None
 
     return atoms
 
@@ -154,7 +242,7 @@ def get_charge_attribute(atoms: Atoms) -> int | None:
         atoms.charge  # type: ignore[attr-defined]
         if getattr(atoms, "charge", None)
         else (
-            round(atoms.get_initial_charges().sum())
+            round(atoms.arrays["initial_charges"].sum())
             if atoms.has("initial_charges")
             else None
         )
@@ -190,7 +278,7 @@ def get_spin_multiplicity_attribute(atoms: Atoms) -> int | None:
     ):
         return round(np.abs(atoms.calc.results["magmoms"].sum())) + 1
     elif atoms.has("initial_magmoms"):
-        return round(np.abs(atoms.get_initial_magnetic_moments().sum())) + 1
+        return round(np.abs(atoms.arrays["initial_magmoms"].sum())) + 1
     else:
         return None
 
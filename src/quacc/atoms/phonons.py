@@ -6,23 +6,19 @@ from importlib.util import find_spec
 from typing import TYPE_CHECKING
 
 import numpy as np
+from ase.atoms import Atoms
 from monty.dev import requires
-from pymatgen.core import Structure
-from pymatgen.io.phonopy import get_phonopy_structure, get_pmg_structure
 
 has_phonopy = bool(find_spec("phonopy"))
 
 if has_phonopy:
     from phonopy import Phonopy
+    from phonopy.structure.atoms import PhonopyAtoms
     from phonopy.structure.cells import get_supercell
 
 if TYPE_CHECKING:
-    from ase.atoms import Atoms
     from numpy.typing import NDArray
 
-    if has_phonopy:
-        from phonopy.structure.atoms import PhonopyAtoms
-
 
 @requires(has_phonopy, "Phonopy not installed.")
 def get_phonopy(
@@ -69,7 +65,7 @@ def get_phonopy(
         )
 
     phonon = Phonopy(
-        get_phonopy_structure(Structure.from_ase_atoms(atoms)),
+        ase_atoms_to_phonopy_atoms(atoms),
         symprec=symprec,
         supercell_matrix=supercell_matrix,
         **phonopy_kwargs,
@@ -93,8 +89,40 @@ def phonopy_atoms_to_ase_atoms(phonpy_atoms: PhonopyAtoms) -> Atoms:
     Atoms
         ASE atoms object
     """
-    pmg_structure = get_pmg_structure(phonpy_atoms)
-    return pmg_structure.to_ase_atoms()
+    return Atoms(
+        symbols=phonpy_atoms.symbols,
+        scaled_positions=phonpy_atoms.scaled_positions,
+        cell=phonpy_atoms.cell,
+        magmoms=phonpy_atoms.magnetic_moments,
+        pbc=True,
+    )
+
+
+@requires(has_phonopy, "Phonopy not installed.")
+def ase_atoms_to_phonopy_atoms(atoms: Atoms) -> PhonopyAtoms:
+    """
+    Convert an ASE atoms object to a phonopy atoms object.
+
+    Parameters
+    ----------
+    atoms
+        ASE atoms object
+
+    Returns
+    -------
+    PhonopyAtoms
+        Phonopy atoms object
+    """
+    return PhonopyAtoms(
+        symbols=atoms.get_chemical_symbols(),
+        cell=atoms.cell.array,
+        scaled_positions=atoms.get_scaled_positions(wrap=False),
+        magnetic_moments=(
+            atoms.get_initial_magnetic_moments()
+            if atoms.has("initial_magmoms")
+            else None
+        ),
+    )
 
 
 def get_atoms_supercell_by_phonopy(
@@ -120,7 +148,5 @@ def get_atoms_supercell_by_phonopy(
     """
 
     return phonopy_atoms_to_ase_atoms(
-        get_supercell(
-            get_phonopy_structure(Structure.from_ase_atoms(atoms)), supercell_matrix
-        )
+        get_supercell(ase_atoms_to_phonopy_atoms(atoms), supercell_matrix)
     )
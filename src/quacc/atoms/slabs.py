@@ -3,27 +3,35 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from hashlib import blake2b
 from logging import getLogger
 from typing import TYPE_CHECKING
 
 import numpy as np
-from pymatgen.analysis.adsorption import AdsorbateSiteFinder
+from pymatgen.analysis.adsorption import AdsorbateSiteFinder, get_mi_vec
 from pymatgen.core.structure import Structure
 from pymatgen.core.surface import Slab, center_slab, generate_all_slabs
 from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.util.coord import in_coord_list_pbc
 
-from quacc.atoms.core import copy_atoms
+from quacc.atoms.core import copy_atoms, get_atoms_id
+from quacc.utils.cache import LRUCache
 
 if TYPE_CHECKING:
     from typing import Literal
 
     from ase.atoms import Atoms
+    from numpy.typing import NDArray
 
     from quacc.types import AdsSiteFinderKwargs, FindAdsSitesKwargs
 
 
 LOGGER = getLogger(__name__)
 
+_RAW_SLABS_CACHE: LRUCache[list[Slab]] = LRUCache(maxsize=8)
+
+_SYMMETRY_CACHE: LRUCache[bool] = LRUCache(maxsize=256)
+
 
 def flip_atoms(
     atoms: Atoms | Structure | Slab, return_struct: bool = False
@@ -47,7 +55,12 @@ def flip_atoms(
     new_atoms = (
         atoms.to_ase_atoms() if isinstance(atoms, Structure) else copy_atoms(atoms)
     )
-    new_atoms.rotate(180, "x")
+
+    # A 180 degree rotation about x is just a sign flip of the y and z
+    # coordinates, which we can do in-place without the temporaries
+    # that `Atoms.rotate` allocates.
+    positions = new_atoms.arrays["positions"]
+    np.negative(positions[:, 1:], out=positions[:, 1:])
     new_atoms.wrap()
 
     if return_struct:
@@ -56,6 +69,207 @@ def flip_atoms(
     return new_atoms
 
 
+def _generate_raw_slabs(
+    atoms: Atoms,
+    max_index: int,
+    min_slab_size: float,
+    min_vacuum_size: float,
+    **slabgen_kwargs,
+) -> list[Slab]:
+    """
+    Generate all (centered) slabs from a bulk atoms object with pymatgen's
+    `generate_all_slabs`. The slabs depend only on the bulk structure and the
+    arguments here, so they are memoized and reused by any later call that
+    differs only in how the slabs are post-processed. Atoms with a calculator
+    attached or unhashable `slabgen_kwargs` are never cached.
+
+    Parameters
+    ----------
+    atoms
+        bulk atoms
+    max_index
+        Maximum Miller index for slab generation
+    min_slab_size
+        Minimum slab size (depth) in angstroms
+    min_vacuum_size
+        Minimum vacuum size in angstroms
+    **slabgen_kwargs
+        Keyword arguments to pass to the pymatgen `generate_all_slabs` function
+
+    Returns
+    -------
+    list[Slab]
+        Copies of the generated slabs, which are safe to modify in-place
+    """
+
+    def _generate() -> list[Slab]:
+        return generate_all_slabs(
+            AseAtomsAdaptor.get_structure(atoms),
+            max_index,
+            min_slab_size,
+            min_vacuum_size,
+            center_slab=True,
+            **slabgen_kwargs,
+        )
+
+    key = None
+    if atoms.calc is None:
+        try:
+            key = (
+                get_atoms_id(atoms, use_md5=False),
+                max_index,
+                min_slab_size,
+                min_vacuum_size,
+                frozenset(slabgen_kwargs.items()),
+            )
+            hash(key)
+        except TypeError:
+            key = None
+
+    slabs = (
+        _generate() if key is None else _RAW_SLABS_CACHE.get_or_compute(key, _generate)
+    )
+    return [slab.copy() for slab in slabs]
+
+
+def _get_surface_mask(slab: Slab, height: float = 0.9) -> NDArray:
+    """
+    Find the surface sites of a slab. This reproduces the surface site labeling
+    of pymatgen's `AdsorbateSiteFinder` but works directly on the coordinate
+    arrays, avoiding the copies of the slab and the site-by-site comparisons
+    that constructing an `AdsorbateSiteFinder` entails.
+
+    Parameters
+    ----------
+    slab
+        The slab to find the surface sites of
+    height
+        Threshold in angstroms of distance from the topmost site along the
+        surface normal to include in the surface site determination
+
+    Returns
+    -------
+    NDArray
+        Boolean mask that is True for the surface sites
+    """
+    cart_coords = slab.cart_coords
+    m_projs = cart_coords @ get_mi_vec(slab)
+    candidates = np.where(m_projs - m_projs.max() >= -height)[0][::-1]
+
+    # Remove any sites that are within the xy tolerance in the miller plane
+    perp_fracs = slab.lattice.get_fractional_coords(
+        cart_coords[candidates] - m_projs[candidates, None]
+    )
+    surface_mask = np.zeros(len(slab), dtype=bool)
+    unique_perp_fracs: list = []
+    for idx, perp_frac in zip(candidates, perp_fracs, strict=True):
+        if not in_coord_list_pbc(unique_perp_fracs, perp_frac):
+            surface_mask[idx] = True
+            unique_perp_fracs.append(perp_frac)
+
+    return surface_mask
+
+
+def _get_flipped_frac_coords(structure: Structure) -> NDArray:
+    """
+    Get the wrapped fractional coordinates of a structure after a 180 degree
+    rotation about the x axis, matching what `flip_atoms` produces.
+
+    Parameters
+    ----------
+    structure
+        The structure to flip
+
+    Returns
+    -------
+    NDArray
+        Fractional coordinates of the flipped structure
+    """
+    cart_coords = structure.cart_coords
+    np.negative(cart_coords[:, 1:], out=cart_coords[:, 1:])
+
+    # Same conversion and wrapping convention as `ase.Atoms.wrap`
+    frac_coords = np.linalg.solve(structure.lattice.matrix.T, cart_coords.T).T
+    eps = 1e-7
+    frac_coords += eps
+    frac_coords %= 1.0
+    frac_coords -= eps
+    return frac_coords
+
+
+def _is_symmetric(slab: Slab) -> bool:
+    """
+    Memoized version of `Slab.is_symmetric`, which runs a full spglib symmetry
+    search on every call. The cache is keyed on the lattice, species, and
+    fractional coordinates (plus magnetic moments, if any), so repeated calls
+    for the same slab skip the symmetry analysis entirely.
+
+    Parameters
+    ----------
+    slab
+        The slab to check
+
+    Returns
+    -------
+    bool
+        True if the two terminations of the slab are equivalent
+    """
+    slab_hash = blake2b(digest_size=16)
+    slab_hash.update(np.ascontiguousarray(slab.lattice.matrix, dtype=np.float64))
+    slab_hash.update(np.ascontiguousarray(slab.atomic_numbers, dtype=np.int32))
+    slab_hash.update(np.ascontiguousarray(slab.frac_coords, dtype=np.float64))
+    if "magmom" in slab.site_properties:
+        slab_hash.update(
+            np.ascontiguousarray(slab.site_properties["magmom"], dtype=np.float64)
+        )
+    return _SYMMETRY_CACHE.get_or_compute(slab_hash.digest(), slab.is_symmetric)
+
+
+def _flip_asymmetric_slab(slab: Slab) -> Slab | None:
+    """
+    Invert a slab if its two terminations are not equivalent.
+
+    Parameters
+    ----------
+    slab
+        The slab to invert
+
+    Returns
+    -------
+    Slab | None
+        The inverted (and centered) slab, or None if the slab is symmetric
+    """
+    if _is_symmetric(slab):
+        return None
+
+    # Flip the slab and its oriented unit cell. This is the same operation as
+    # `flip_atoms` but done directly on the coordinate arrays, which avoids
+    # round-tripping each structure through an ASE Atoms object.
+    oriented_unit_cell = slab.oriented_unit_cell
+    new_oriented_unit_cell = Structure(
+        oriented_unit_cell.lattice,
+        oriented_unit_cell.species,
+        _get_flipped_frac_coords(oriented_unit_cell),
+        site_properties=oriented_unit_cell.site_properties,
+    )
+
+    # Reconstruct the full slab object, noting the new shift and
+    # oriented unit cell
+    new_slab = Slab(
+        slab.lattice,
+        slab.species,
+        coords=_get_flipped_frac_coords(slab),
+        miller_index=slab.miller_index,
+        oriented_unit_cell=new_oriented_unit_cell,
+        shift=-slab.shift,
+        scale_factor=slab.scale_factor,
+        site_properties=slab.site_properties,
+    )
+
+    # It looks better to center the inverted slab so we do that here.
+    return center_slab(new_slab)
+
+
 def make_slabs_from_bulk(
     atoms: Atoms,
     max_index: int = 1,
@@ -101,87 +315,47 @@ def make_slabs_from_bulk(
     # code for adjustments for 2D:
     # https://github.com/oxana-a/atomate/blob/ads_wf/atomate/vasp/firetasks/adsorption_tasks.py
 
-    # Use pymatgen to generate slabs
-    struct = AseAtomsAdaptor.get_structure(atoms)
-
-    # Make all the slabs
-    slabs = generate_all_slabs(
-        struct,
-        max_index,
-        min_slab_size,
-        min_vacuum_size,
-        center_slab=True,
-        **slabgen_kwargs,
+    # Use pymatgen to make all the slabs
+    slabs = _generate_raw_slabs(
+        atoms, max_index, min_slab_size, min_vacuum_size, **slabgen_kwargs
     )
 
     # If the two terminations are not equivalent, make new slab by inverting the
-    # original slab and add it to the list
+    # original slab and add it to the list.
     if flip_asymmetric:
-        new_slabs = []
-        for slab in slabs:
-            if not slab.is_symmetric():
-                # Flip the slab and its oriented unit cell
-                new_slab = flip_atoms(slab, return_struct=True)  # type: Slab
-                new_oriented_unit_cell = flip_atoms(
-                    slab.oriented_unit_cell, return_struct=True
-                )  # type: Slab
-
-                # Reconstruct the full slab object, noting the new shift and
-                # oriented unit cell
-                new_slab = Slab(
-                    new_slab.lattice,
-                    new_slab.species,
-                    coords=new_slab.frac_coords,
-                    miller_index=slab.miller_index,
-                    oriented_unit_cell=new_oriented_unit_cell,
-                    shift=-slab.shift,
-                    scale_factor=slab.scale_factor,
-                    site_properties=new_slab.site_properties,
-                )
-
-                # It looks better to center the inverted slab so we do that
-                # here.
-                new_slab = center_slab(new_slab)
-
-                # Add the new slab to the list
-                new_slabs.append(new_slab)
-
-        slabs.extend(new_slabs)
+        flipped_slabs = [_flip_asymmetric_slab(slab) for slab in slabs]
+        slabs.extend(slab for slab in flipped_slabs if slab is not None)
 
     # For each slab, make sure the lengths and widths are large enough and fix
     # atoms z_fix away from the top of the slab.
     slabs_with_props = []
-    for slab in slabs:
+    abc = np.array([slab.lattice.abc for slab in slabs]).reshape(-1, 3)
+    supercell_factors = np.ceil(min_length_width / abc[:, :2]).astype(int)
+    for slab, (a_factor, b_factor) in zip(slabs, supercell_factors, strict=True):
         # Make sure desired atoms are on surface
         if allowed_surface_symbols:
             # Find atoms at surface
-            surf_sites = AdsorbateSiteFinder(deepcopy(slab)).surface_sites
-            surface_species = [s.specie.symbol for s in surf_sites]
-
-        if allowed_surface_symbols and all(
-            allowed_surface_atom not in surface_species
-            for allowed_surface_atom in allowed_surface_symbols
-        ):
-            continue
+            surface_species = {
+                site.specie.symbol
+                for site, is_surface in zip(slab, _get_surface_mask(slab), strict=True)
+                if is_surface
+            }
+            if surface_species.isdisjoint(allowed_surface_symbols):
+                continue
 
         # Supercell creation (if necessary)
-        a_factor = round(np.ceil(min_length_width / slab.lattice.abc[0]))
-        b_factor = round(np.ceil(min_length_width / slab.lattice.abc[1]))
         slab.make_supercell([a_factor, b_factor, 1])
 
         # Add constraints. Note: This does not actually add an adsorbate
         if z_fix:
-            sel_dyn = AdsorbateSiteFinder(
-                deepcopy(slab), selective_dynamics=True, height=z_fix
-            ).slab.site_properties["selective_dynamics"]
+            surface_mask = _get_surface_mask(slab, height=z_fix)
+            sel_dyn = np.repeat(surface_mask[:, None], 3, axis=1).tolist()
             slab.add_site_property("selective_dynamics", sel_dyn)
 
         # Add slab to list
         slabs_with_props.append(slab)
 
     final_slabs: list[Atoms] = []
-    if not slabs_with_props:
-        return final_slabs
 
     # Make atoms objects and store slab stats
     for slab_with_props in slabs_with_props:
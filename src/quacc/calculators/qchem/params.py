@@ -41,7 +41,7 @@ def make_qc_input(qchem: QChem, atoms: Atoms) -> QCInput:
     """
     atoms.charge = qchem.charge  # type: ignore[attr-defined]
     atoms.spin_multiplicity = qchem.spin_multiplicity  # type: ignore[attr-defined]
-    molecule = AseAtomsAdaptor().get_molecule(atoms)
+    molecule = AseAtomsAdaptor.get_molecule(atoms)
 
     if qchem.qchem_dict_set_params:
         # Get minimal parameters needed to instantiate a QChemDictSet
@@ -58,7 +58,7 @@ def get_param_swaps(
     """
     is_metal = check_is_metal(input_atoms)
     calc = Vasp_(**user_calc_params)
-    max_Z = input_atoms.get_atomic_numbers().max()
+    max_Z = input_atoms.numbers.max()
 
     if (
         not calc.int_params["lmaxmix"] or calc.int_params["lmaxmix"] < 6
@@ -175,7 +175,10 @@ def get_param_swaps(
 
     if not calc.int_params["lorbit"] and (
         calc.int_params["ispin"] == 2
-        or np.any(input_atoms.get_initial_magnetic_moments() != 0)
+        or (
+            input_atoms.has("initial_magmoms")
+            and np.any(input_atoms.arrays["initial_magmoms"] != 0)
+        )
     ):
         LOGGER.info(
             "Recommending LORBIT = 11 because you have a spin-polarized calculation."
@@ -48,6 +48,7 @@ def phonon_subflow(
     t_step: float = 10,
     t_min: float = 0,
     t_max: float = 1000,
+    mesh: float | tuple[int, int, int] = 100.0,
     phonopy_kwargs: dict[str, Any] | None = None,
     additional_fields: dict[str, Any] | None = None,
 ) -> PhononSchema:
@@ -80,6 +81,10 @@ def phonon_subflow(
         Min temperature (K).
     t_max
         Max temperature (K).
+    mesh
+        The q-point mesh used for the density of states and thermodynamic
+        properties. A float is a length density (A) from which Phonopy
+        determines the mesh, and a tuple gives the mesh numbers directly.
     phonopy_kwargs
         Additional kwargs to pass to the Phonopy class.
     additional_fields
@@ -132,13 +137,14 @@ def phonon_subflow(
         t_step: float,
         t_min: float,
         t_max: float,
+        mesh: float | tuple[int, int, int],
         additional_fields: dict[str, Any] | None,
     ) -> PhononSchema:
         parameters = force_job_results[-1].get("parameters")
-        forces = [
-            output["results"]["forces"][: len(phonopy.supercell)]
-            for output in force_job_results
-        ]
+        n_atoms = len(phonopy.supercell)
+        forces = np.empty((len(force_job_results), n_atoms, 3))
+        for i, output in enumerate(force_job_results):
+            forces[i] = output["results"]["forces"][:n_atoms]
         phonopy_results = PhonopyRunner().run_phonopy(
             phonopy,
             forces,
@@ -146,6 +152,7 @@ def phonon_subflow(
             t_step=t_step,
             t_min=t_min,
             t_max=t_max,
+            mesh=mesh,
         )
 
         return summarize_phonopy(
@@ -167,5 +174,5 @@ def phonon_subflow(
 
     force_job_results = _get_forces_subflow(supercells)
     return _thermo_job(
-        atoms, phonopy, force_job_results, t_step, t_min, t_max, additional_fields
+        atoms, phonopy, force_job_results, t_step, t_min, t_max, mesh, additional_fields
     )
@@ -68,7 +68,8 @@ def bands_pw_job(
         to manually copy files. The directory will be ungzipped if necessary.
     make_bandpath
         If True, it returns the primitive cell for your structure and generates
-        the high symmetry k-path using Latmer-Munro approach.
+        the high symmetry k-path using Latmer-Munro approach. The k-path is
+        not generated if `kpts` or `kspacing` is passed in `calc_kwargs`.
         For more information look at
         [pymatgen.symmetry.bandstructure.HighSymmKpath][]
     line_density
@@ -100,12 +101,13 @@ def bands_pw_job(
         structure = AseAtomsAdaptor.get_structure(atoms)
         primitive = SpacegroupAnalyzer(structure).get_primitive_standard_structure()
         atoms = primitive.to_ase_atoms()
-        calc_defaults["kpts"] = bandpath(
-            convert_pmg_kpts(
-                {"line_density": line_density}, atoms, force_gamma=force_gamma
-            )[0],
-            cell=atoms.get_cell(),
-        )
+        if "kpts" not in calc_kwargs and "kspacing" not in calc_kwargs:
+            calc_defaults["kpts"] = bandpath(
+                convert_pmg_kpts(
+                    {"line_density": line_density}, atoms, force_gamma=force_gamma
+                )[0],
+                cell=atoms.get_cell(),
+            )
 
     return run_and_summarize(
         atoms,
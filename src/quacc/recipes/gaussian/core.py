@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import psutil
@@ -17,6 +18,20 @@ if TYPE_CHECKING:
     from quacc.types import Filenames, RunSchema, SourceDirectory
 
 
+@lru_cache(maxsize=1)
+def _get_nprocshared() -> int:
+    """
+    Get the number of physical cores to use for Gaussian. This is looked up
+    once per process since psutil has to query the OS on every call.
+
+    Returns
+    -------
+    int
+        Number of physical cores
+    """
+    return psutil.cpu_count(logical=False)
+
+
 @job
 def static_job(
     atoms: Atoms,
@@ -60,7 +75,7 @@ def static_job(
     calc_defaults = {
         "mem": "16GB",
         "chk": "Gaussian.chk",
-        "nprocshared": psutil.cpu_count(logical=False),
+        "nprocshared": _get_nprocshared(),
         "xc": xc,
         "basis": basis,
         "charge": charge,
@@ -130,7 +145,7 @@ def relax_job(
     calc_defaults = {
         "mem": "16GB",
         "chk": "Gaussian.chk",
-        "nprocshared": psutil.cpu_count(logical=False),
+        "nprocshared": _get_nprocshared(),
         "xc": xc,
         "basis": basis,
         "charge": charge,
@@ -43,6 +43,7 @@ def phonon_flow(
     t_step: float = 10,
     t_min: float = 0,
     t_max: float = 1000,
+    mesh: float | tuple[int, int, int] = 100.0,
     job_params: dict[str, dict[str, Any]] | None = None,
     job_decorators: dict[str, Callable | None] | None = None,
 ) -> PhononSchema:
@@ -84,6 +85,10 @@ def phonon_flow(
         Min temperature (K).
     t_max
         Max temperature (K).
+    mesh
+        The q-point mesh used for the density of states and thermodynamic
+        properties. A float is a length density (A) from which Phonopy
+        determines the mesh, and a tuple gives the mesh numbers directly.
     job_params
         Custom parameters to pass to each Job in the Flow. This is a dictionary where
         the keys are the names of the jobs and the values are dictionaries of parameters.
@@ -116,5 +121,6 @@ def phonon_flow(
         t_step=t_step,
         t_min=t_min,
         t_max=t_max,
+        mesh=mesh,
         additional_fields={"name": f"{method} Phonons"},
     )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from copy import copy, deepcopy
 from importlib.util import find_spec
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ase.vibrations.data import VibrationsData
@@ -11,6 +13,7 @@ from monty.dev import requires
 from quacc import get_settings, job
 from quacc.runners.ase import Runner
 from quacc.schemas.ase import Summarize, VibSummarize
+from quacc.utils.cache import LRUCache
 from quacc.utils.dicts import recursive_dict_merge
 
 has_sella = bool(find_spec("sella"))
@@ -25,6 +28,7 @@ if TYPE_CHECKING:
     from typing import Any
 
     from ase.atoms import Atoms
+    from ase.calculators.calculator import Calculator
 
     from quacc.types import (
         Filenames,
@@ -35,6 +39,8 @@ if TYPE_CHECKING:
         VibThermoSchema,
     )
 
+_CALCULATOR_CACHE: LRUCache[Calculator] = LRUCache(maxsize=4)
+
 
 @job
 @requires(
@@ -75,7 +81,7 @@ def static_job(
     }
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
 
-    calc = NewtonNet(**calc_flags)
+    calc = _get_newtonnet_calculator(**calc_flags)
     final_atoms = Runner(atoms, calc, copy_files=copy_files).run_calc()
 
     return Summarize(
@@ -129,7 +135,7 @@ def relax_job(
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
     opt_flags = recursive_dict_merge(opt_defaults, opt_params)
 
-    calc = NewtonNet(**calc_flags)
+    calc = _get_newtonnet_calculator(**calc_flags)
     dyn = Runner(atoms, calc, copy_files=copy_files).run_opt(**opt_flags)
 
     return _add_stdev_and_hess(
@@ -184,7 +190,7 @@ def freq_job(
     }
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
 
-    calc = NewtonNet(**calc_flags)
+    calc = _get_newtonnet_calculator(**calc_flags)
     final_atoms = Runner(atoms, calc, copy_files=copy_files).run_calc()
 
     summary = Summarize(
@@ -235,8 +241,8 @@ def _add_stdev_and_hess(summary: dict[str, Any], **calc_kwargs) -> dict[str, Any
         "settings_path": settings.NEWTONNET_CONFIG_PATH,
     }
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
+    calc = _get_newtonnet_calculator(**calc_flags)
     for i, atoms in enumerate(summary["trajectory"]):
-        calc = NewtonNet(**calc_flags)
         results = Runner(atoms, calc).run_calc().calc.results
         summary["trajectory_results"][i]["hessian"] = results["hessian"]
         summary["trajectory_results"][i]["energy_std"] = results["energy_disagreement"]
@@ -246,3 +252,93 @@ def _add_stdev_and_hess(summary: dict[str, Any], **calc_kwargs) -> dict[str, Any
         ]
 
     return summary
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert lists and dicts into hashable equivalents.
+
+    Parameters
+    ----------
+    value
+        Value to convert
+
+    Returns
+    -------
+    Any
+        Hashable version of the value
+    """
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    return value
+
+
+def _get_model_mtimes(*paths: Any) -> tuple[int | None, ...]:
+    """
+    Get the modification times of the model and config files, so that a cached
+    calculator is not reused after a file has been overwritten. Entries that
+    are not existing files (e.g. names of pretrained models) give `None`.
+
+    Parameters
+    ----------
+    *paths
+        Paths, or lists of paths, to the model and config files.
+
+    Returns
+    -------
+    tuple[int | None, ...]
+        Modification time in nanoseconds of each file.
+    """
+    mtimes = []
+    for path in paths:
+        for file in path if isinstance(path, list | tuple) else [path]:
+            try:
+                mtimes.append(Path(file).stat().st_mtime_ns)
+            except (TypeError, OSError):
+                mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _get_newtonnet_calculator(**calc_flags) -> Calculator:
+    """
+    Get a NewtonNet calculator. Instantiating a NewtonNet calculator loads the
+    model weights from disk, so the loaded calculators are kept in a small
+    cache keyed on `calc_flags` and the modification times of the model and
+    config files. Each call returns a fresh shallow copy of the cached
+    calculator with its own parameters, results, and atoms and its own copies
+    of any list or dict attributes (e.g. `models`, `properties`, `device`).
+    The loaded torch modules themselves are shared, which is safe since
+    `MLAseCalculator` only runs them in inference mode after loading.
+
+    Parameters
+    ----------
+    **calc_flags
+        Keyword arguments for the NewtonNet calculator.
+
+    Returns
+    -------
+    Calculator
+        NewtonNet calculator
+    """
+    try:
+        key = (
+            _freeze(calc_flags),
+            _get_model_mtimes(
+                calc_flags.get("model_path"), calc_flags.get("settings_path")
+            ),
+        )
+        hash(key)
+    except TypeError:
+        return NewtonNet(**calc_flags)
+
+    calc = _CALCULATOR_CACHE.get_or_compute(key, lambda: NewtonNet(**calc_flags))
+
+    new_calc = copy(calc)
+    for attr, value in vars(calc).items():
+        if isinstance(value, list | dict):
+            setattr(new_calc, attr, copy(value))
+    new_calc.parameters = deepcopy(calc.parameters)
+    new_calc.reset()
+    return new_calc
@@ -10,7 +10,12 @@ from ase.mep import NEB
 from monty.dev import requires
 
 from quacc import change_settings, get_settings, job, strip_decorator
-from quacc.recipes.newtonnet.core import _add_stdev_and_hess, freq_job, relax_job
+from quacc.recipes.newtonnet.core import (
+    _add_stdev_and_hess,
+    _get_newtonnet_calculator,
+    freq_job,
+    relax_job,
+)
 from quacc.runners.ase import Runner
 from quacc.schemas.ase import Summarize
 from quacc.utils.dicts import recursive_dict_merge
@@ -21,8 +26,6 @@ has_newtonnet = bool(find_spec("newtonnet"))
 
 if has_sella:
     from sella import IRC, Sella
-if has_newtonnet:
-    from newtonnet.utils.ase_interface import MLAseCalculator as NewtonNet
 if has_geodesic_interpolate:
     from quacc.atoms.ts import geodesic_interpolate_wrapper
 
@@ -105,7 +108,7 @@ def ts_job(
     if use_custom_hessian:
         opt_flags["optimizer_kwargs"]["hessian_function"] = _get_hessian
 
-    calc = NewtonNet(**calc_flags)
+    calc = _get_newtonnet_calculator(**calc_flags)
 
     # Run the TS optimization
     dyn = Runner(atoms, calc).run_opt(**opt_flags)
@@ -184,7 +187,7 @@ def irc_job(
     opt_flags = recursive_dict_merge(opt_defaults, opt_params)
 
     # Define calculator
-    calc = NewtonNet(**calc_flags)
+    calc = _get_newtonnet_calculator(**calc_flags)
 
     # Run IRC
     with change_settings({"CHECK_CONVERGENCE": False}):
@@ -330,7 +333,7 @@ def neb_job(
     neb_flags = recursive_dict_merge(neb_defaults, neb_kwargs)
 
     # Define calculator
-    calc = NewtonNet(**calc_flags)
+    calc = _get_newtonnet_calculator(**calc_flags)
 
     # Run relax job
     relax_summary_r = strip_decorator(relax_job)(reactant_atoms, **relax_job_kwargs)
@@ -429,8 +432,8 @@ def geodesic_job(
     )
 
     # Define calculator
-    reactant_atoms.calc = NewtonNet(**calc_flags)
-    product_atoms.calc = NewtonNet(**calc_flags)
+    reactant_atoms.calc = _get_newtonnet_calculator(**calc_flags)
+    product_atoms.calc = _get_newtonnet_calculator(**calc_flags)
 
     # Run IRC
     relax_summary_r = strip_decorator(relax_job)(reactant_atoms, **relax_job_kwargs)
@@ -444,7 +447,7 @@ def geodesic_job(
 
     potential_energies = []
     for image in images:
-        image.calc = NewtonNet(**calc_flags)
+        image.calc = _get_newtonnet_calculator(**calc_flags)
         potential_energies.append(image.get_potential_energy())
 
     ts_index = np.argmax(potential_energies)
@@ -488,6 +491,6 @@ def _get_hessian(atoms: Atoms, **calc_kwargs) -> NDArray:
         "hess_method": "autograd",
     }
     calc_flags = recursive_dict_merge(calc_defaults, calc_kwargs)
-    calc = NewtonNet(**calc_flags)
+    calc = _get_newtonnet_calculator(**calc_flags)
     calc.calculate(atoms)
     return calc.results["hessian"].reshape((-1, 3 * len(atoms)))
@@ -11,9 +11,14 @@ from shutil import copy, copytree
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
+from ase.atoms import Atoms
 from ase.calculators import calculator
+from ase.calculators.calculator import all_properties
+from ase.calculators.singlepoint import SinglePointCalculator
 from ase.filters import FrechetCellFilter
-from ase.io import Trajectory, read
+from ase.io import read
+from ase.io.jsonio import decode, encode
+from ase.io.trajectory import TrajectoryWriter
 from ase.md.md import MolecularDynamics
 from ase.md.velocitydistribution import (
     MaxwellBoltzmannDistribution,
@@ -42,7 +47,6 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any
 
-    from ase.atoms import Atoms
     from ase.calculators.calculator import Calculator
     from ase.optimize.optimize import Dynamics, Optimizer
 
@@ -134,12 +138,7 @@ class Runner(BaseRunner):
 
             # Make sure the atom indices didn't get updated somehow (sanity check).
             # If this happens, there is a serious problem.
-            if (
-                np.array_equal(
-                    atoms_new.get_atomic_numbers(), self.atoms.get_atomic_numbers()
-                )
-                is False
-            ):
+            if not np.array_equal(atoms_new.numbers, self.atoms.numbers):
                 raise ValueError(
                     "Atomic numbers do not match between atoms and geom_file."
                 )
@@ -222,7 +221,7 @@ class Runner(BaseRunner):
 
         # Define the Trajectory object
         traj_file = self.tmpdir / traj_filename
-        traj = Trajectory(traj_file, "w", atoms=self.atoms)
+        traj = _CollectingTrajectoryWriter(traj_file, "w", atoms=self.atoms)
         merged_optimizer_kwargs["trajectory"] = traj
 
         # Set volume relaxation constraints, if relevant
@@ -427,7 +426,7 @@ class Runner(BaseRunner):
 
         # Define the Trajectory object
         traj_file = neb_tmpdir / traj_filename
-        traj = Trajectory(traj_file, "w", atoms=neb)
+        traj = _CollectingTrajectoryWriter(traj_file, "w", atoms=neb)
 
         # Set volume relaxation constraints, if relevant
         if relax_cell:
@@ -502,3 +501,105 @@ class Runner(BaseRunner):
 
         if not self.atoms.pbc.any() and "internal" not in optimizer_kwargs:
             optimizer_kwargs["internal"] = True
+
+
+class _CollectingTrajectoryWriter(TrajectoryWriter):
+    """
+    A TrajectoryWriter that also keeps an in-memory copy of every frame it writes.
+    Each frame is built only from the data that the writer stores in the file
+    (numbers, positions, cell, pbc, constraints, masses, tags, momenta, initial
+    magnetic moments and charges, JSON-serializable info, and the calculator
+    results), so the frames match what `read(filename, index=":")` would return
+    and downstream schemas can use them without re-parsing the file from disk.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.frames: list[Atoms] = []
+
+    def write(self, atoms: Atoms | None = None, **kwargs: Any) -> None:
+        """
+        Write the atoms to the file and keep a snapshot of each written image.
+
+        Parameters
+        ----------
+        atoms
+            The Atoms object (or NEB) to write. Defaults to the one the writer
+            was created with.
+        **kwargs
+            Extra properties to write, e.g. `energy`.
+
+        Returns
+        -------
+        None
+        """
+        super().write(atoms, **kwargs)
+        atoms = self.atoms if atoms is None else atoms
+        self.frames.extend(
+            _snapshot_trajectory_frame(image, **kwargs) for image in atoms.iterimages()
+        )
+
+
+def _snapshot_trajectory_frame(atoms: Atoms, **kwargs: Any) -> Atoms:
+    """
+    Make a detached copy of a trajectory frame holding only the data that an
+    ASE trajectory file stores for it.
+
+    Parameters
+    ----------
+    atoms
+        The Atoms object that was just written.
+    **kwargs
+        Extra properties passed to `write()`.
+
+    Returns
+    -------
+    Atoms
+        The snapshot of the frame.
+    """
+    info = {}
+    for key, value in atoms.info.items():
+        try:
+            info[key] = decode(encode(value), always_array=False)
+        except TypeError:
+            continue
+
+    frame = Atoms(
+        numbers=atoms.numbers,
+        positions=atoms.get_positions(),
+        cell=atoms.cell.array,
+        pbc=atoms.pbc,
+        masses=atoms.get_masses() if atoms.has("masses") else None,
+        tags=atoms.get_tags() if atoms.has("tags") else None,
+        momenta=atoms.get_momenta() if atoms.has("momenta") else None,
+        magmoms=(
+            atoms.get_initial_magnetic_moments()
+            if atoms.has("initial_magmoms")
+            else None
+        ),
+        charges=(atoms.get_initial_charges() if atoms.has("initial_charges") else None),
+        info=info,
+        constraint=(
+            deepcopy(atoms.constraints)
+            if all(hasattr(c, "todict") for c in atoms.constraints)
+            else None
+        ),
+    )
+
+    calc = atoms.calc
+    if calc is None and not kwargs:
+        return frame
+
+    calc_results = getattr(calc, "results", {})
+    results = {
+        prop: deepcopy(kwargs[prop] if prop in kwargs else calc_results[prop])
+        for prop in all_properties
+        if prop in kwargs or prop in calc_results
+    }
+    frame.calc = SinglePointCalculator(frame, **results)
+    frame.calc.implemented_properties = list(results)
+    if calc is not None:
+        frame.calc.name = calc.name
+        if hasattr(calc, "todict"):
+            frame.calc.parameters.update(deepcopy(calc.todict()))
+    return frame
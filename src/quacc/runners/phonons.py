@@ -40,6 +40,7 @@ class PhonopyRunner(BaseRunner):
         t_step: float = 10,
         t_min: float = 0,
         t_max: float = 1000,
+        mesh: float | tuple[int, int, int] = 100.0,
     ) -> Phonopy:
         """
         Run a phonopy calculation in a temporary directory and
@@ -59,6 +60,9 @@ class PhonopyRunner(BaseRunner):
             Minimum temperature
         t_max
             Maximum temperature
+        mesh
+            The q-point mesh. A float is a length density (A) from which Phonopy
+            determines the mesh, and a tuple gives the mesh numbers directly.
 
         Returns
         -------
@@ -74,7 +78,7 @@ class PhonopyRunner(BaseRunner):
             phonon.symmetrize_force_constants()
             phonon.symmetrize_force_constants_by_space_group()
 
-        phonon.run_mesh(with_eigenvectors=True)
+        phonon.run_mesh(mesh=mesh, with_eigenvectors=True)
         phonon.run_total_dos()
         phonon.run_thermal_properties(t_step=t_step, t_max=t_max, t_min=t_min)
         phonon.auto_band_structure(
@@ -8,10 +8,8 @@ from pathlib import Path
 from shutil import move, rmtree
 from typing import TYPE_CHECKING
 
-from monty.shutil import gzip_dir
-
 from quacc import JobFailure, get_settings
-from quacc.utils.files import copy_decompress_files, make_unique_dir
+from quacc.utils.files import copy_decompress_files, gzip_dir, make_unique_dir
 
 if TYPE_CHECKING:
     from ase.atoms import Atoms
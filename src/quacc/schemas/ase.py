@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from math import sqrt
 from typing import TYPE_CHECKING
 
 import numpy as np
+from ase import units
 from ase.io import read
 from ase.vibrations.data import VibrationsData
 from emmet.core.symmetry import PointGroupData
@@ -28,6 +30,7 @@ if TYPE_CHECKING:
     from ase.optimize.optimize import Optimizer
     from ase.vibrations import Vibrations
     from maggma.core import Store
+    from numpy.typing import NDArray
 
     from quacc.types import (
         DefaultSetting,
@@ -38,6 +41,9 @@ if TYPE_CHECKING:
         VibThermoSchema,
     )
 
+# Converts sqrt(eigenvalues) of the mass-weighted Hessian (eV/A^2/amu) to eV
+_VIB_ENERGY_CONVERSION = units._hbar * units.m / sqrt(units._e * units._amu)
+
 
 class Summarize:
     """
@@ -197,7 +203,10 @@ class Summarize:
         if trajectory:
             atoms_trajectory = trajectory
         else:
-            atoms_trajectory = read(dyn.trajectory.filename, index=":")  # type: ignore[union-attr]
+            atoms_trajectory = getattr(dyn.trajectory, "frames", None) or read(
+                dyn.trajectory.filename,  # type: ignore[union-attr]
+                index=":",
+            )
 
         trajectory_results = [atoms.calc.results for atoms in atoms_trajectory]
 
@@ -329,7 +338,10 @@ class Summarize:
         if trajectory:
             atoms_trajectory = trajectory
         else:
-            atoms_trajectory = read(dyn.trajectory.filename, index=":")  # type: ignore[union-attr]
+            atoms_trajectory = getattr(dyn.trajectory, "frames", None) or read(
+                dyn.trajectory.filename,  # type: ignore[union-attr]
+                index=":",
+            )
 
         if n_iter_return == -1:
             atoms_trajectory = atoms_trajectory[-(n_images):]
@@ -440,9 +452,15 @@ class VibSummarize:
         """
         store = self._settings.STORE if store == QuaccDefault else store
 
-        # Tabulate input parameters
-        vib_freqs_raw = self.vib_object.get_frequencies().tolist()
-        vib_energies_raw = self.vib_object.get_energies().tolist()
+        # Tabulate input parameters. The Hessian is diagonalized only once here:
+        # `Vibrations.get_frequencies()` and `Vibrations.get_energies()` would
+        # each re-read the displacement cache and rebuild a VibrationsData.
+        vib_data = (
+            self.vib_object
+            if isinstance(self.vib_object, VibrationsData)
+            else self.vib_object.get_vibrations()
+        )
+        vib_energies_complex = _get_vib_energies(vib_data)
         if isinstance(self.vib_object, VibrationsData):
             atoms = self.vib_object._atoms
             directory = self.directory
@@ -465,13 +483,11 @@ class VibSummarize:
             }
 
         # Convert imaginary modes to negative values for DB storage
-        for i, f in enumerate(vib_freqs_raw):
-            if np.imag(f) > 0:
-                vib_freqs_raw[i] = -np.abs(f)
-                vib_energies_raw[i] = -np.abs(vib_energies_raw[i])
-            else:
-                vib_freqs_raw[i] = np.abs(f)
-                vib_energies_raw[i] = np.abs(vib_energies_raw[i])
+        signs = np.where(vib_energies_complex.imag > 0, -1.0, 1.0)
+        vib_energies_raw_array = signs * np.abs(vib_energies_complex)
+        vib_freqs_raw_array = signs * np.abs(vib_energies_complex / units.invcm)
+        vib_freqs_raw = vib_freqs_raw_array.tolist()
+        vib_energies_raw = vib_energies_raw_array.tolist()
 
         # Get the true vibrational modes
         atoms_metadata = atoms_to_metadata(
@@ -485,22 +501,24 @@ class VibSummarize:
         elif is_molecule:
             is_linear = (
                 PointGroupData()
-                .from_molecule(AseAtomsAdaptor().get_molecule(atoms))
+                .from_molecule(AseAtomsAdaptor.get_molecule(atoms))
                 .linear
                 if atoms.pbc.any()
                 else atoms_metadata["symmetry"]["linear"]
             )
 
             # Sort by absolute value
-            vib_freqs_raw_sorted = vib_freqs_raw.copy()
-            vib_energies_raw_sorted = vib_energies_raw.copy()
-            vib_freqs_raw_sorted.sort(key=np.abs)
-            vib_energies_raw_sorted.sort(key=np.abs)
+            vib_freqs_raw_sorted = vib_freqs_raw_array[
+                np.argsort(np.abs(vib_freqs_raw_array), kind="stable")
+            ]
+            vib_energies_raw_sorted = vib_energies_raw_array[
+                np.argsort(np.abs(vib_energies_raw_array), kind="stable")
+            ]
 
             # Cut the 3N-5 or 3N-6 modes based on their absolute value
             n_modes = 3 * natoms - 5 if is_linear else 3 * natoms - 6
-            vib_freqs = vib_freqs_raw_sorted[-n_modes:]
-            vib_energies = vib_energies_raw_sorted[-n_modes:]
+            vib_freqs = vib_freqs_raw_sorted[-n_modes:].tolist()
+            vib_energies = vib_energies_raw_sorted[-n_modes:].tolist()
         else:
             vib_freqs = vib_freqs_raw
             vib_energies = vib_energies_raw
@@ -634,3 +652,37 @@ def _get_nth_iteration(
     if end_idx < len(neb_trajectory) - 1:
         result.extend(neb_trajectory[-(n_images):])
     return result
+
+
+def _get_vib_energies(vib_data: VibrationsData) -> NDArray:
+    """
+    Get the harmonic mode energies from a VibrationsData object. This is
+    equivalent to `VibrationsData.get_energies()` but only computes the
+    eigenvalues of the mass-weighted Hessian, skipping the eigenvectors
+    (and the normal modes built from them) that we never use.
+
+    Parameters
+    ----------
+    vib_data
+        VibrationsData object
+
+    Returns
+    -------
+    NDArray
+        Harmonic mode energies in eV. Imaginary modes have imaginary energies.
+    """
+    masses = vib_data._atoms.get_masses()[vib_data.get_mask()]
+    if not np.all(masses):
+        raise ValueError(
+            "Zero mass encountered in one or more of the vibrated atoms. "
+            "Use Atoms.set_masses() to set all masses to non-zero values."
+        )
+
+    # M^-1/2 H M^-1/2, applied by broadcasting rather than forming a 3N x 3N
+    # divisor
+    inv_sqrt_masses = np.repeat(masses**-0.5, 3)
+    omega2 = np.linalg.eigvalsh(
+        vib_data.get_hessian_2d() * inv_sqrt_masses * inv_sqrt_masses[:, None]
+    )
+
+    return _VIB_ENERGY_CONVERSION * np.sqrt(omega2.astype(complex))
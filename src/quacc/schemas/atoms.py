@@ -52,9 +52,8 @@ def atoms_to_metadata(
         Dict of metadata about the Atoms object.
     """
     additional_fields = additional_fields or {}
-    atoms = copy_atoms(atoms)
+    atoms = copy_atoms(atoms, copy_calc=False)
     results = {}
-    atoms.calc = None
 
     # Set any charge or multiplicity keys
     if not atoms.pbc.any():
@@ -78,12 +77,12 @@ def atoms_to_metadata(
     # generating pymatgen Structure/Molecule metadata, so we'll just use that.
     if get_metadata:
         if atoms.pbc.any():
-            struct = AseAtomsAdaptor().get_structure(atoms)
+            struct = AseAtomsAdaptor.get_structure(atoms)
             metadata = StructureMetadata().from_structure(struct).model_dump()
             if store_pmg:
                 results["structure"] = struct
         else:
-            mol = AseAtomsAdaptor().get_molecule(atoms, charge_spin_check=False)
+            mol = AseAtomsAdaptor.get_molecule(atoms, charge_spin_check=False)
             metadata = MoleculeMetadata().from_molecule(mol).model_dump()
             if store_pmg:
                 results["molecule"] = mol
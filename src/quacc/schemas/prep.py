@@ -33,21 +33,17 @@ def prep_next_run(atoms: Atoms, move_magmoms: bool = False) -> Atoms:
     Atoms
         Updated Atoms object.
     """
-    atoms = copy_atoms(atoms)
-
-    if (
-        move_magmoms
-        and hasattr(atoms, "calc")
-        and getattr(atoms.calc, "results", None) is not None
-    ):
-        atoms.set_initial_magnetic_moments(
-            atoms.calc.results.get("magmoms", [0.0] * len(atoms))
-        )
+    calc = getattr(atoms, "calc", None)
 
     # Clear off the calculator so we can run a new job. If we don't do this,
     # then something like atoms *= (2,2,2) still has a calculator attached,
     # which is a bit confusing.
-    atoms.calc = None
+    atoms = copy_atoms(atoms, copy_calc=False)
+
+    if move_magmoms and getattr(calc, "results", None) is not None:
+        atoms.set_initial_magnetic_moments(
+            calc.results.get("magmoms", [0.0] * len(atoms))
+        )
 
     # Give the Atoms object a unique ID. This will be helpful for querying
     # later. Also store any old IDs somewhere else for future reference. Note:
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from hashlib import blake2b
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from ase.thermochemistry import HarmonicThermo, IdealGasThermo
 from ase.units import invcm
 from emmet.core.symmetry import PointGroupData
@@ -14,22 +16,23 @@ from pymatgen.io.ase import AseAtomsAdaptor
 from quacc import QuaccDefault, __version__, get_settings
 from quacc.atoms.core import get_spin_multiplicity_attribute
 from quacc.schemas.atoms import atoms_to_metadata
+from quacc.utils.cache import LRUCache
 from quacc.utils.dicts import finalize_dict
 from quacc.utils.files import get_uri
 
-if TYPE_CHECKING:
-    from ase.atoms import Atoms
-
 if TYPE_CHECKING:
     from typing import Any
 
     from ase.atoms import Atoms
     from maggma.core import Store
+    from numpy.typing import NDArray
 
     from quacc.types import DefaultSetting, ThermoSchema
 
 LOGGER = getLogger(__name__)
 
+_POINT_GROUP_CACHE: LRUCache[tuple[bool, int]] = LRUCache(maxsize=1024)
+
 
 class ThermoSummarize:
     """
@@ -39,7 +42,7 @@ class ThermoSummarize:
     def __init__(
         self,
         atoms: Atoms,
-        vib_freqs: list[float | complex],
+        vib_freqs: list[float | complex] | NDArray,
         energy: float = 0.0,
         directory: str | Path | None = None,
         charge_and_multiplicity: tuple[int, int] | None = None,
@@ -69,13 +72,18 @@ class ThermoSummarize:
         None
         """
         self.atoms = atoms
-        # Make sure vibrational freqs are imaginary, not negative
-        vib_freqs_ = vib_freqs.copy()
-        for i, f in enumerate(vib_freqs_):
-            if not isinstance(f, complex) and f < 0:
-                vib_freqs_[i] = complex(0 - f * 1j)
+        # Make sure vibrational freqs are imaginary, not negative. Values that
+        # are already complex are left as-is.
+        vib_freqs_ = np.array(vib_freqs, dtype=complex)
+        is_real = (
+            np.full(len(vib_freqs_), not np.iscomplexobj(vib_freqs))
+            if isinstance(vib_freqs, np.ndarray)
+            else np.array([not isinstance(f, complex) for f in vib_freqs], dtype=bool)
+        )
+        is_negative = is_real & (vib_freqs_.real < 0)
+        vib_freqs_[is_negative] = -1j * vib_freqs_.real[is_negative]
         self.vib_freqs = vib_freqs_
-        self.vib_energies = [f * invcm for f in self.vib_freqs]
+        self.vib_energies = vib_freqs_ * invcm
         self.energy = energy
         self.directory = Path(directory or atoms.calc.directory)
         self.charge_and_multiplicity = charge_and_multiplicity
@@ -86,7 +94,7 @@ class ThermoSummarize:
         self,
         temperature: float = 298.15,
         pressure: float = 1.0,
-        store: Store | None | DefaultSetting = QuaccDefault,
+        store: Store | DefaultSetting | None = QuaccDefault,
     ) -> ThermoSchema:
         """
         Get tabulated results from an ASE IdealGasThermo object and store them in a
@@ -127,7 +135,7 @@ class ThermoSummarize:
                 "pressure": pressure,
                 "sigma": igt.sigma,
                 "spin_multiplicity": spin_multiplicity,
-                "vib_freqs": [e / invcm for e in igt.vib_energies],
+                "vib_freqs": (igt.vib_energies / invcm).tolist(),
                 "vib_energies": igt.vib_energies.tolist(),
                 "n_imag": igt.n_imag,
                 "method": "ideal_gas",
@@ -166,7 +174,7 @@ class ThermoSummarize:
         self,
         temperature: float = 298.15,
         pressure: float = 1.0,
-        store: Store | None | DefaultSetting = QuaccDefault,
+        store: Store | DefaultSetting | None = QuaccDefault,
     ) -> ThermoSchema:
         """
         Get tabulated results from an ASE HarmonicThermo object and store them in a
@@ -196,7 +204,7 @@ class ThermoSummarize:
             "parameters_thermo": {
                 "temperature": temperature,
                 "pressure": pressure,
-                "vib_freqs": [e / invcm for e in harmonic_thermo.vib_energies],
+                "vib_freqs": (harmonic_thermo.vib_energies / invcm).tolist(),
                 "vib_energies": harmonic_thermo.vib_energies.tolist(),
                 "n_imag": harmonic_thermo.n_imag,
                 "method": "harmonic",
@@ -250,14 +258,13 @@ class ThermoSummarize:
         spin = round((spin_multiplicity - 1) / 2, 1) if spin_multiplicity else 0
 
         # Get symmetry for later use
-        mol = AseAtomsAdaptor().get_molecule(self.atoms, charge_spin_check=False)
-        point_group_data = PointGroupData().from_molecule(mol)
+        linear, rotation_number = _get_point_group_data(self.atoms)
 
         # Get the geometry
         natoms = len(self.atoms)
         if natoms == 1:
             geometry = "monatomic"
-        elif point_group_data.linear:
+        elif linear:
             geometry = "linear"
         else:
             geometry = "nonlinear"
@@ -267,7 +274,7 @@ class ThermoSummarize:
             geometry,
             potentialenergy=self.energy,
             atoms=self.atoms,
-            symmetrynumber=point_group_data.rotation_number,
+            symmetrynumber=rotation_number,
             spin=spin,
             ignore_imag_modes=True,
         )
@@ -286,3 +293,31 @@ class ThermoSummarize:
             potentialenergy=self.energy,
             ignore_imag_modes=True,
         )
+
+
+def _get_point_group_data(atoms: Atoms) -> tuple[bool, int]:
+    """
+    Get the linearity and rotational symmetry number of a molecule. The
+    point-group analysis is memoized on the atomic numbers and positions, so
+    repeated thermochemistry calls on the same geometry skip it entirely.
+
+    Parameters
+    ----------
+    atoms
+        The molecule to analyze
+
+    Returns
+    -------
+    tuple[bool, int]
+        Whether the molecule is linear, and its rotational symmetry number
+    """
+    atoms_hash = blake2b(digest_size=16)
+    atoms_hash.update(np.ascontiguousarray(atoms.numbers, dtype=np.int32))
+    atoms_hash.update(np.ascontiguousarray(atoms.positions, dtype=np.float64))
+
+    def _compute() -> tuple[bool, int]:
+        mol = AseAtomsAdaptor.get_molecule(atoms, charge_spin_check=False)
+        point_group_data = PointGroupData().from_molecule(mol)
+        return bool(point_group_data.linear), int(point_group_data.rotation_number)
+
+    return _POINT_GROUP_CACHE.get_or_compute(atoms_hash.digest(), _compute)
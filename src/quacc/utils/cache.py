@@ -0,0 +1,89 @@
+"""Utility functions for in-memory caching."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+_V = TypeVar("_V")
+
+
+class LRUCache(Generic[_V]):
+    """
+    A small thread-safe least-recently-used cache. Unlike `functools.lru_cache`,
+    the key is supplied by the caller, which allows caching the results of
+    functions whose inputs (e.g. Atoms objects) are not hashable themselves.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        maxsize
+            Maximum number of entries to keep. The least recently used entry
+            is evicted once this is exceeded.
+
+        Returns
+        -------
+        None
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, _V] = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], _V]) -> _V:
+        """
+        Return the cached value for `key`, calling `compute` to create (and
+        store) it if it is not cached yet. `compute` is called without holding
+        the lock, so concurrent misses on the same key may both compute it.
+
+        Parameters
+        ----------
+        key
+            The cache key.
+        compute
+            Function of no arguments that returns the value for `key`.
+
+        Returns
+        -------
+        _V
+            The cached or newly computed value. It is shared with later callers,
+            so it must not be modified in-place.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+
+        value = compute()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
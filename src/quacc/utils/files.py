@@ -5,19 +5,24 @@ from __future__ import annotations
 import contextlib
 import os
 import socket
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timezone
+from gzip import GzipFile
 from logging import getLogger
 from pathlib import Path
 from random import randint
-from shutil import copy
+from shutil import copy, copyfileobj, copystat
 from typing import TYPE_CHECKING
 
 from monty.io import zopen
 from monty.os.path import zpath
-from monty.shutil import copy_r, decompress_dir, decompress_file
+from monty.shutil import copy_r, decompress_file
 from ruamel.yaml import YAML
 
+from quacc.utils.cache import LRUCache
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -26,6 +31,14 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+_YAML_CACHE: LRUCache[Any] = LRUCache(maxsize=64)
+
+_MAKE_UNIQUE_DIR_MAX_ATTEMPTS = 100
+
+# Jobs already run in parallel across workflow workers, so keep the per-job
+# pools used for (de)compressing files small
+_MAX_IO_WORKERS = 4
+
 
 def check_logfile(logfile: str | Path, check_str: str) -> bool:
     """
@@ -136,6 +149,8 @@ def copy_decompress_files(
     if not isinstance(filenames, list):
         filenames = [filenames]
 
+    # Copy everything first and collect the files that may need decompressing
+    files_to_decompress: dict[Path, None] = {}
     for f in filenames:
         globs_found = list(source_directory.glob(str(f)))
         if not globs_found:
@@ -150,10 +165,24 @@ def copy_decompress_files(
                 continue
             if source_filepath.is_file():
                 copy(source_filepath, destination_filepath)
-                decompress_file(destination_filepath)
+                files_to_decompress[destination_filepath] = None
             elif source_filepath.is_dir():
                 copy_r(source_filepath, destination_filepath)
-                decompress_dir(destination_filepath)
+                for parent, _, files in os.walk(destination_filepath):
+                    files_to_decompress.update(
+                        dict.fromkeys(Path(parent, file) for file in files)
+                    )
+
+    # Decompression is CPU-bound and releases the GIL, so the (independent)
+    # files are decompressed concurrently
+    if len(files_to_decompress) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(files_to_decompress), _MAX_IO_WORKERS)
+        ) as executor:
+            list(executor.map(decompress_file, files_to_decompress))
+    else:
+        for filepath in files_to_decompress:
+            decompress_file(filepath)
 
 
 def make_unique_dir(
@@ -173,16 +202,28 @@ def make_unique_dir(
     -------
     Path
         Path to the job directory.
+
+    Raises
+    ------
+    FileExistsError
+        If no unused directory name is found after a fixed number of attempts.
     """
     time_now = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H-%M-%S-%f")
     if prefix is None:
         prefix = ""
-    job_dir = Path(f"{prefix}{time_now}-{randint(10000, 99999)}")
-    if base_path:
-        job_dir = Path(base_path, job_dir)
-    job_dir.mkdir(parents=True)
-
-    return job_dir
+    attempt = 0
+    while True:
+        attempt += 1
+        job_dir = Path(f"{prefix}{time_now}-{randint(10000, 99999)}")
+        if base_path:
+            job_dir = Path(base_path, job_dir)
+        try:
+            job_dir.mkdir(parents=True)
+        except FileExistsError:
+            if attempt >= _MAKE_UNIQUE_DIR_MAX_ATTEMPTS:
+                raise
+            continue
+        return job_dir
 
 
 def load_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
@@ -210,7 +251,7 @@ def load_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
         raise FileNotFoundError(msg)
 
     # Load YAML file
-    config = YAML().load(yaml_path)
+    config = _load_yaml(yaml_path)
 
     # Inherit arguments from any parent YAML files but do not overwrite those in
     # the child file.
@@ -236,6 +277,30 @@ def load_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
     return config
 
 
+def _load_yaml(yaml_path: Path) -> Any:
+    """
+    Parse a YAML file. The parsed contents are cached on the resolved path,
+    modification time, and size of the file, so repeated loads of the same
+    preset skip the parser while edits to the file are still picked up. A copy
+    is returned so callers are free to modify the result.
+
+    Parameters
+    ----------
+    yaml_path
+        Path to the YAML file.
+
+    Returns
+    -------
+    Any
+        The parsed contents of the YAML file.
+    """
+    yaml_path = yaml_path.resolve()
+    stat = yaml_path.stat()
+    key = (str(yaml_path), stat.st_mtime_ns, stat.st_size)
+
+    return deepcopy(_YAML_CACHE.get_or_compute(key, lambda: YAML().load(yaml_path)))
+
+
 def find_recent_logfile(
     directory: Path | str, logfile_extensions: str | list[str]
 ) -> Path:
@@ -314,3 +379,76 @@ def safe_decompress_dir(path: str | Path) -> None:
                 decompress_file(Path(parent, f))
             except FileNotFoundError:
                 LOGGER.debug(f"Cannot find {f} in {parent}. Skipping.")
+
+
+def gzip_dir(path: str | Path, compresslevel: int = 6) -> None:
+    """
+    Gzips all files in a directory, in the same way as `monty.shutil.gzip_dir`.
+    The files are compressed concurrently since DEFLATE releases the GIL.
+
+    Parameters
+    ----------
+    path
+        Path to the directory.
+    compresslevel
+        Level of compression, 1-9.
+
+    Returns
+    -------
+    None
+    """
+    files_to_gzip = []
+    for root, _, files in os.walk(Path(path)):
+        for f in files:
+            full_f = Path(root, f).resolve()
+            if Path(f).suffix.lower() != ".gz" and not full_f.is_dir():
+                if Path(f"{full_f}.gz").exists():
+                    warnings.warn(f"Both {f} and {f}.gz exist.", stacklevel=2)
+                    continue
+                files_to_gzip.append(full_f)
+
+    # A symlink and its target resolve to the same file, which must only be
+    # compressed once
+    files_to_gzip = list(dict.fromkeys(files_to_gzip))
+
+    if len(files_to_gzip) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(files_to_gzip), _MAX_IO_WORKERS)
+        ) as executor:
+            list(
+                executor.map(
+                    _gzip_file, files_to_gzip, [compresslevel] * len(files_to_gzip)
+                )
+            )
+    else:
+        for full_f in files_to_gzip:
+            _gzip_file(full_f, compresslevel)
+
+
+def _gzip_file(filepath: Path, compresslevel: int) -> None:
+    """
+    Gzip a single file, preserving its metadata, and remove the original.
+
+    Parameters
+    ----------
+    filepath
+        Path to the file.
+    compresslevel
+        Level of compression, 1-9.
+
+    Returns
+    -------
+    None
+    """
+    gz_filepath = f"{filepath}.gz"
+    if not filepath.exists() or Path(gz_filepath).exists():
+        LOGGER.debug(f"Skipping {filepath} since it is missing or already gzipped.")
+        return
+
+    with (
+        filepath.open("rb") as f_in,
+        GzipFile(gz_filepath, "wb", compresslevel=compresslevel) as f_out,
+    ):
+        copyfileobj(f_in, f_out, length=1 << 20)
+    copystat(filepath, gz_filepath)
+    filepath.unlink()
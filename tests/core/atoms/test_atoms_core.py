@@ -13,6 +13,7 @@ from numpy.testing import assert_allclose
 from quacc.atoms.core import (
     check_charge_and_spin,
     check_is_metal,
+    copy_atoms,
     get_atoms_id,
     get_atoms_id_parsl,
     get_spin_multiplicity_attribute,
@@ -35,6 +36,26 @@ def test_init():
     assert Atoms.from_dict(atoms.as_dict()) == atoms
 
 
+def test_copy_atoms():
+    atoms = bulk("Cu")
+    atoms.calc = EMT()
+    atoms.info["test"] = [1]
+    atoms.charge = 1
+
+    new_atoms = copy_atoms(atoms)
+    assert new_atoms == atoms
+    assert new_atoms.calc is not atoms.calc
+    assert isinstance(new_atoms.calc, EMT)
+
+    new_atoms = copy_atoms(atoms, copy_calc=False)
+    assert new_atoms == atoms
+    assert new_atoms.calc is None
+    assert atoms.calc is not None
+    assert new_atoms.charge == 1
+    new_atoms.info["test"].append(2)
+    assert atoms.info["test"] == [1]
+
+
 def test_get_atoms_id():
     atoms = bulk("Cu")
     md5hash = "d4859270a1a67083343bec0ab783f774"
@@ -48,6 +69,23 @@ def test_get_atoms_id():
     assert get_atoms_id(atoms) == md5maghash
 
 
+def test_get_atoms_id_fast():
+    atoms = bulk("Cu")
+    fast_hash = get_atoms_id(atoms, use_md5=False)
+    assert len(fast_hash) == 32
+    assert fast_hash != get_atoms_id(atoms)
+
+    atoms.info["test"] = "hi"
+    assert get_atoms_id(atoms, use_md5=False) == fast_hash
+
+    atoms.set_initial_magnetic_moments([1.0])
+    assert get_atoms_id(atoms, use_md5=False) != fast_hash
+
+    atoms2 = bulk("Cu")
+    atoms2.positions[0, 0] += 1e-6
+    assert get_atoms_id(atoms2, use_md5=False) != fast_hash
+
+
 def test_get_atoms_id_parsl():
     atoms = bulk("Cu")
 
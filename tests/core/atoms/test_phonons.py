@@ -9,7 +9,12 @@ import numpy as np
 from ase.build import bulk
 from numpy.testing import assert_almost_equal, assert_array_equal
 
-from quacc.atoms.phonons import get_atoms_supercell_by_phonopy, get_phonopy
+from quacc.atoms.phonons import (
+    ase_atoms_to_phonopy_atoms,
+    get_atoms_supercell_by_phonopy,
+    get_phonopy,
+    phonopy_atoms_to_ase_atoms,
+)
 
 
 def test_get_phonopy():
@@ -40,3 +45,21 @@ def test_get_supercell_by_phonopy():
 
     supercell = get_atoms_supercell_by_phonopy(atoms, cell)
     assert_almost_equal(np.diag(np.diag(supercell.cell)), supercell.cell)
+
+
+def test_phonopy_atoms_round_trip():
+    atoms = bulk("NaCl", "rocksalt", a=5.6)
+    atoms.set_initial_magnetic_moments([1.0, -0.5])
+
+    phonopy_atoms = ase_atoms_to_phonopy_atoms(atoms)
+    assert phonopy_atoms.symbols == ["Na", "Cl"]
+    assert_almost_equal(phonopy_atoms.magnetic_moments, [1.0, -0.5])
+
+    new_atoms = phonopy_atoms_to_ase_atoms(phonopy_atoms)
+    assert_array_equal(new_atoms.numbers, atoms.numbers)
+    assert_almost_equal(new_atoms.positions, atoms.positions)
+    assert_almost_equal(new_atoms.cell.array, atoms.cell.array)
+    assert_almost_equal(new_atoms.get_initial_magnetic_moments(), [1.0, -0.5])
+    assert new_atoms.pbc.all()
+
+    assert ase_atoms_to_phonopy_atoms(bulk("Cu")).magnetic_moments is None
@@ -7,7 +7,10 @@ import numpy as np
 import pytest
 from ase.build import bulk, fcc100, molecule
 from ase.io import read
+from pymatgen.analysis.adsorption import AdsorbateSiteFinder
 
+from quacc.atoms import slabs as slabs_module
+from quacc.atoms.core import get_atoms_id
 from quacc.atoms.slabs import (
     flip_atoms,
     get_surface_energy,
@@ -18,13 +21,6 @@ from quacc.atoms.slabs import (
 FILE_DIR = Path(__file__).parent
 
 
-@pytest.fixture
-def atoms_mag():
-    FILE_DIR = Path(__file__).parent
-
-    return read(FILE_DIR / ".." / "calculators" / "vasp" / "OUTCAR_mag.gz")
-
-
 def test_flip_atoms():
     atoms = read(FILE_DIR / "ZnTe.cif.gz")
     atoms.info["test"] = "hi"
@@ -115,6 +111,78 @@ def test_make_slabs_from_bulk(atoms_mag):
         assert np.round(np.min(d[d != 0]), 4) == np.round(min_d, 4)
 
 
+def test_make_slabs_from_bulk_cached(monkeypatch):
+    atoms = bulk("Cu")
+    slabs_module._RAW_SLABS_CACHE.clear()
+
+    n_calls = 0
+    generate_all_slabs = slabs_module.generate_all_slabs
+
+    def _counted_generate_all_slabs(*args, **kwargs):
+        nonlocal n_calls
+        n_calls += 1
+        return generate_all_slabs(*args, **kwargs)
+
+    monkeypatch.setattr(slabs_module, "generate_all_slabs", _counted_generate_all_slabs)
+
+    slabs = make_slabs_from_bulk(atoms)
+    slabs2 = make_slabs_from_bulk(atoms.copy(), z_fix=None, min_length_width=4.0)
+    assert n_calls == 1
+    assert len(slabs) == len(slabs2)
+    assert len(slabs[0]) > len(slabs2[0])
+    assert len(slabs2[0].constraints) == 0
+    assert make_slabs_from_bulk(atoms) == slabs
+    assert n_calls == 1
+
+    make_slabs_from_bulk(atoms, max_index=2)
+    assert n_calls == 2
+
+
+def test_make_slabs_from_bulk_string_array():
+    atoms = bulk("Cu")
+    atoms.new_array("names", np.array(["x"]))
+    slabs = make_slabs_from_bulk(atoms)
+    assert len(slabs) == 4
+
+    atoms2 = bulk("Cu")
+    atoms2.new_array("names", np.array(["y"]))
+    assert get_atoms_id(atoms2, use_md5=False) != get_atoms_id(atoms, use_md5=False)
+
+
+def test_get_flipped_frac_coords():
+    atoms = read(FILE_DIR / "ZnTe.cif.gz")
+    for slab in slabs_module._generate_raw_slabs(atoms, 1, 10.0, 20.0):
+        ref = flip_atoms(slab, return_struct=True)
+        frac_coords = slabs_module._get_flipped_frac_coords(slab)
+        diff = frac_coords - ref.frac_coords
+        assert np.allclose(diff - np.round(diff), 0.0, atol=1e-8)
+
+
+def test_is_symmetric_cached(monkeypatch):
+    atoms = read(FILE_DIR / "ZnTe.cif.gz")
+    slabs = slabs_module._generate_raw_slabs(atoms, 1, 10.0, 20.0)
+    ref = [slab.is_symmetric() for slab in slabs]
+    slabs_module._SYMMETRY_CACHE.clear()
+    assert [slabs_module._is_symmetric(slab) for slab in slabs] == ref
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("is_symmetric should not be called")
+
+    monkeypatch.setattr(slabs_module.Slab, "is_symmetric", _fail)
+    assert [slabs_module._is_symmetric(slab.copy()) for slab in slabs] == ref
+
+
+@pytest.mark.parametrize("height", [0.9, 2.0])
+def test_get_surface_mask(height):
+    atoms = read(FILE_DIR / "ZnTe.cif.gz")
+    for slab in slabs_module._generate_raw_slabs(atoms, 1, 10.0, 20.0):
+        slab.make_supercell([2, 2, 1])
+        ref_slab = AdsorbateSiteFinder(deepcopy(slab), height=height).slab
+        assert slabs_module._get_surface_mask(slab, height=height).tolist() == [
+            prop == "surface" for prop in ref_slab.site_properties["surface_properties"]
+        ]
+
+
 def test_make_adsorbate_structures():
     h2o = molecule("H2O")
     atoms = fcc100("Cu", size=(2, 2, 2))
@@ -13,7 +13,6 @@ from ase.build import bulk
 from ase.calculators.singlepoint import SinglePointDFTCalculator
 from ase.calculators.vasp import Vasp as Vasp_
 from ase.constraints import FixAtoms, FixBondLength
-from ase.io import read
 from pymatgen.io.vasp.sets import MPRelaxSet, MPScanRelaxSet
 
 from quacc import change_settings, get_settings
@@ -27,21 +26,6 @@ LOGGER = getLogger(__name__)
 LOGGER.propagate = True
 
 
-@pytest.fixture
-def atoms_mag():
-    return read(FILE_DIR / "OUTCAR_mag.gz")
-
-
-@pytest.fixture
-def atoms_nomag():
-    return read(FILE_DIR / "OUTCAR_nomag.gz")
-
-
-@pytest.fixture
-def atoms_nospin():
-    return read(FILE_DIR / "OUTCAR_nospin.gz")
-
-
 def test_vanilla_vasp():
     atoms = bulk("Cu")
     calc = Vasp(atoms, incar_copilot=False)
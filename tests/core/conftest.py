@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import os
+from copy import deepcopy
 from pathlib import Path
 from shutil import rmtree
 
+import pytest
+from ase.io import read
+
 TEST_RESULTS_DIR = Path(__file__).parent / "_test_results"
 TEST_SCRATCH_DIR = Path(__file__).parent / "_test_scratch"
+VASP_TEST_DIR = Path(__file__).parent / "calculators" / "vasp"
 
 
 def pytest_sessionstart():
@@ -19,3 +24,26 @@ def pytest_sessionfinish(exitstatus):
     rmtree(TEST_RESULTS_DIR, ignore_errors=True)
     if exitstatus == 0:
         rmtree(TEST_SCRATCH_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def _outcar_atoms():
+    return {
+        name: read(VASP_TEST_DIR / f"OUTCAR_{name}.gz")
+        for name in ("mag", "nomag", "nospin")
+    }
+
+
+@pytest.fixture
+def atoms_mag(_outcar_atoms):
+    return deepcopy(_outcar_atoms["mag"])
+
+
+@pytest.fixture
+def atoms_nomag(_outcar_atoms):
+    return deepcopy(_outcar_atoms["nomag"])
+
+
+@pytest.fixture
+def atoms_nospin(_outcar_atoms):
+    return deepcopy(_outcar_atoms["nospin"])
@@ -36,6 +36,13 @@ def test_phonon_flow(tmp_path, monkeypatch):
     assert "total_dos" in output["results"]
 
 
+def test_phonon_flow_mesh(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    atoms = bulk("Cu")
+    output = phonon_flow(atoms, min_lengths=5.0, mesh=(4, 4, 4))
+    assert output["results"]["mesh_properties"]["weights"].sum() == 64
+
+
 def test_phonon_flow_v2(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     atoms = bulk("Cu") * (2, 2, 2)
@@ -5,18 +5,21 @@ from shutil import which
 
 import pytest
 from ase.build import bulk
+from ase.dft.kpoints import BandPath
 from numpy.testing import assert_allclose
 
-from quacc.recipes.espresso.bands import bands_flow
+from quacc.recipes.espresso import _base
+from quacc.recipes.espresso.bands import bands_flow, bands_pw_job
 from quacc.utils.files import copy_decompress_files
 
-pytestmark = pytest.mark.skipif(
+requires_qe = pytest.mark.skipif(
     which("pw.x") is None or which("bands.x") is None, reason="QE not installed"
 )
 
 DATA_DIR = Path(__file__).parent / "data"
 
 
+@requires_qe
 def test_bands_flow(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OMP_NUM_THREADS", "1")
@@ -48,6 +51,7 @@ def test_bands_flow(tmp_path, monkeypatch):
     assert output["bands_pp"]["name"] == "bands.x post-processing"
 
 
+@requires_qe
 def test_bands_flow_with_fermi(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("OMP_NUM_THREADS", "1")
@@ -85,3 +89,31 @@ def test_bands_flow_with_fermi(tmp_path, monkeypatch):
     assert output["bands_pw"]["results"]["nbands"] == 4
 
     assert output["fermi_surface"]["name"] == "fs.x fermi_surface"
+
+
+def test_bands_pw_job_explicit_kpts(monkeypatch):
+    captured = {}
+
+    class MockRunner:
+        def __init__(self, atoms, calc, **kwargs):
+            self.atoms = atoms
+            captured["calc"] = calc
+
+        def run_calc(self, **kwargs):
+            return self.atoms
+
+    class MockSummarize:
+        def __init__(self, **kwargs):
+            pass
+
+        def run(self, final_atoms, atoms):
+            return {"atoms": final_atoms}
+
+    monkeypatch.setattr(_base, "Runner", MockRunner)
+    monkeypatch.setattr(_base, "Summarize", MockSummarize)
+
+    bands_pw_job(bulk("Si"), kpts=(3, 3, 3))
+    assert captured["calc"].parameters["kpts"] == (3, 3, 3)
+
+    bands_pw_job(bulk("Si"), line_density=1)
+    assert isinstance(captured["calc"].parameters["kpts"], BandPath)
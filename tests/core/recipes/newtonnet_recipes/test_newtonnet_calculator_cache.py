@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+
+from ase.calculators.calculator import Calculator
+
+from quacc.recipes.newtonnet import core as newtonnet_core
+
+
+class DummyNewtonNet(Calculator):
+    implemented_properties = ["energy"]  # noqa: RUF012
+    n_inits = 0
+
+    def __init__(self, model_path=None, properties=None, **kwargs):
+        super().__init__(**kwargs)
+        self.models = [object()]
+        self.properties = properties or ["energy"]
+        DummyNewtonNet.n_inits += 1
+
+
+def test_get_newtonnet_calculator_cached(monkeypatch):
+    monkeypatch.setattr(newtonnet_core, "NewtonNet", DummyNewtonNet, raising=False)
+    monkeypatch.setattr(DummyNewtonNet, "n_inits", 0)
+    newtonnet_core._CALCULATOR_CACHE.clear()
+
+    calc1 = newtonnet_core._get_newtonnet_calculator(model_path=["a"], device="cpu")
+    calc2 = newtonnet_core._get_newtonnet_calculator(model_path=["a"], device="cpu")
+    assert DummyNewtonNet.n_inits == 1
+    assert calc1 is not calc2
+    assert calc1.parameters == calc2.parameters
+    assert calc1.models[0] is calc2.models[0]
+
+    calc1.set(device="cuda")
+    calc1.properties.append("forces")
+    calc1.models.append(object())
+    assert calc2.parameters["device"] == "cpu"
+    assert calc2.properties == ["energy"]
+    assert len(calc2.models) == 1
+    calc3 = newtonnet_core._get_newtonnet_calculator(model_path=["a"], device="cpu")
+    assert calc3.parameters["device"] == "cpu"
+    assert calc3.properties == ["energy"]
+    assert DummyNewtonNet.n_inits == 1
+
+    newtonnet_core._get_newtonnet_calculator(model_path=["b"], device="cpu")
+    assert DummyNewtonNet.n_inits == 2
+
+    newtonnet_core._get_newtonnet_calculator(model_path=["a"], device={"x": {1}})
+    newtonnet_core._get_newtonnet_calculator(model_path=["a"], device={"x": {1}})
+    assert DummyNewtonNet.n_inits == 4
+    assert len(newtonnet_core._CALCULATOR_CACHE) == 2
+
+
+def test_get_newtonnet_calculator_model_changed(monkeypatch, tmp_path):
+    monkeypatch.setattr(newtonnet_core, "NewtonNet", DummyNewtonNet, raising=False)
+    monkeypatch.setattr(DummyNewtonNet, "n_inits", 0)
+    newtonnet_core._CALCULATOR_CACHE.clear()
+
+    model_path = tmp_path / "model.pt"
+    model_path.write_text("weights")
+    newtonnet_core._get_newtonnet_calculator(model_path=str(model_path))
+    newtonnet_core._get_newtonnet_calculator(model_path=str(model_path))
+    assert DummyNewtonNet.n_inits == 1
+
+    mtime_ns = model_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(model_path, ns=(mtime_ns, mtime_ns))
+    newtonnet_core._get_newtonnet_calculator(model_path=str(model_path))
+    assert DummyNewtonNet.n_inits == 2
@@ -20,6 +20,7 @@ from ase import Atoms
 from ase.build import bulk, molecule
 from ase.calculators.emt import EMT
 from ase.calculators.lj import LennardJones
+from ase.constraints import FixAtoms
 from ase.io import read
 from ase.mep.neb import NEBOptimizer
 from ase.optimize import BFGS, BFGSLineSearch
@@ -207,6 +208,38 @@ def test_run_opt2(tmp_path, monkeypatch):
     assert traj[-1].calc.results is not None
 
 
+def test_run_opt_collects_frames(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    atoms = bulk("Cu") * (2, 1, 1)
+    atoms[0].position += 0.1
+    atoms.set_initial_magnetic_moments([1.0, 0.0])
+    atoms.set_tags([1, 0])
+    atoms.new_array("tag2", np.array([3, 4]))
+    atoms.info["test"] = (1, 2)
+    atoms.set_constraint(FixAtoms(indices=[1]))
+
+    dyn = Runner(atoms, EMT()).run_opt(relax_cell=True)
+    traj = read(dyn.trajectory.filename, index=":")
+
+    assert len(dyn.trajectory.frames) == len(traj)
+    for frame, ref in zip(dyn.trajectory.frames, traj, strict=True):
+        assert frame.arrays.keys() == ref.arrays.keys()
+        assert "tag2" not in frame.arrays
+        for key, value in ref.arrays.items():
+            assert np.allclose(frame.arrays[key], value)
+        assert np.allclose(frame.cell.array, ref.cell.array)
+        assert frame.pbc.tolist() == ref.pbc.tolist()
+        assert frame.info == ref.info
+        assert [c.todict() for c in frame.constraints] == [
+            c.todict() for c in ref.constraints
+        ]
+        assert frame.calc.name == ref.calc.name
+        assert frame.calc.parameters == ref.calc.parameters
+        assert frame.calc.results.keys() == ref.calc.results.keys()
+        for key, value in ref.calc.results.items():
+            assert np.allclose(frame.calc.results[key], value)
+
+
 def test_run_scipy_opt(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     atoms = bulk("Cu") * (2, 1, 1)
@@ -4,6 +4,7 @@ import os
 from copy import deepcopy
 from pathlib import Path
 
+import numpy as np
 import pytest
 from ase.build import bulk, molecule
 from ase.calculators.emt import EMT
@@ -15,7 +16,7 @@ from maggma.stores import MemoryStore
 from monty.json import MontyDecoder, jsanitize
 from monty.serialization import loadfn
 
-from quacc.schemas.ase import Summarize, VibSummarize
+from quacc.schemas.ase import Summarize, VibSummarize, _get_vib_energies
 
 FILE_DIR = Path(__file__).parent
 
@@ -273,6 +274,23 @@ def test_vib_run2(monkeypatch, tmp_path):
     assert results["results"]["vib_energies"][0] == pytest.approx(0.0)
 
 
+def test_get_vib_energies(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    atoms = molecule("CH4")
+    atoms.calc = EMT()
+    vib = Vibrations(atoms)
+    vib.run()
+    vib_data = vib.get_vibrations()
+    assert _get_vib_energies(vib_data) == pytest.approx(
+        vib_data.get_energies(), abs=1e-10
+    )
+
+    atoms.set_masses(np.zeros(len(atoms)))
+    with pytest.raises(ValueError, match="Zero mass"):
+        _get_vib_energies(type(vib_data)(atoms, vib_data.get_hessian()))
+
+
 def test_summarize_vib_and_thermo_run1(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
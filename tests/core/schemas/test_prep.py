@@ -1,37 +1,16 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from pathlib import Path
 
 import numpy as np
-import pytest
 from ase.atoms import Atoms
 from ase.build import bulk, molecule
 from ase.calculators.emt import EMT
-from ase.io import read
 
 from quacc.atoms.core import get_atoms_id
 from quacc.schemas.prep import prep_next_run
 
 
-@pytest.fixture
-def atoms_mag():
-    file_dir = Path(__file__).parent
-    return read(file_dir / ".." / "calculators" / "vasp" / "OUTCAR_mag.gz")
-
-
-@pytest.fixture
-def atoms_nomag():
-    file_dir = Path(__file__).parent
-    return read(file_dir / ".." / "calculators" / "vasp" / "OUTCAR_nomag.gz")
-
-
-@pytest.fixture
-def atoms_nospin():
-    file_dir = Path(__file__).parent
-    return read(file_dir / ".." / "calculators" / "vasp" / "OUTCAR_nospin.gz")
-
-
 def test_init():
     atoms = bulk("Cu")
     assert Atoms.from_dict(atoms.as_dict()) == atoms
@@ -92,3 +71,24 @@ def test_prep_magmoms(atoms_mag, atoms_nomag, atoms_nospin):
     mags = atoms.get_magnetic_moments()
     atoms = prep_next_run(atoms, move_magmoms=False)
     assert atoms.has("initial_magmoms") is False
+
+
+def test_prep_next_run_skips_calc_copy(atoms_mag):
+    class UncopyableCalc(EMT):
+        def __deepcopy__(self, memo):
+            raise RuntimeError("The calculator should not be copied")
+
+    atoms = bulk("Cu")
+    atoms.info["_id"] = "test"
+    atoms.calc = UncopyableCalc()
+    new_atoms = prep_next_run(atoms)
+    assert new_atoms.calc is None
+    assert new_atoms.info["_old_ids"] == ["test"]
+    assert isinstance(atoms.calc, UncopyableCalc)
+    assert atoms.info.get("_old_ids") is None
+
+    mags = atoms_mag.get_magnetic_moments()
+    new_atoms = prep_next_run(atoms_mag, move_magmoms=True)
+    assert new_atoms.get_initial_magnetic_moments().tolist() == mags.tolist()
+    assert atoms_mag.has("initial_magmoms") is False
+    assert atoms_mag.calc is not None
@@ -11,7 +11,11 @@ from ase.units import invcm
 from monty.json import MontyDecoder, jsanitize
 from monty.serialization import loadfn
 
-from quacc.schemas.thermo import ThermoSummarize
+from quacc.schemas.thermo import (
+    _POINT_GROUP_CACHE,
+    ThermoSummarize,
+    _get_point_group_data,
+)
 
 LOGGER = getLogger(__name__)
 LOGGER.propagate = True
@@ -43,6 +47,25 @@ def test_run_ideal_gas(tmp_path):
     assert igt.get_ZPE_correction() == pytest.approx(2548.5 * invcm)
 
 
+def test_vib_freqs_imaginary(tmp_path):
+    co2 = molecule("CO2")
+    summary = ThermoSummarize(
+        co2, [complex(-100, 0), -50.0, 100.0, 3j], directory=tmp_path
+    )
+    assert summary.vib_freqs.tolist() == [-100, 50j, 100, 3j]
+    assert summary.vib_energies.tolist() == pytest.approx(
+        [-100 * invcm, 50j * invcm, 100 * invcm, 3j * invcm]
+    )
+
+    summary = ThermoSummarize(co2, np.array([-50.0, 100.0]), directory=tmp_path)
+    assert summary.vib_freqs.tolist() == [50j, 100]
+
+    summary = ThermoSummarize(
+        co2, np.array([-50.0, 100.0], dtype=complex), directory=tmp_path
+    )
+    assert summary.vib_freqs.tolist() == [-50, 100]
+
+
 def test_summarize_ideal_gas_thermo1(tmp_path):
     # Make sure metadata is made
     atoms = molecule("N2")
@@ -213,3 +236,14 @@ def test_summarize_harmonic_thermo(tmp_path):
     # test document can be jsanitized and decoded
     d = jsanitize(results, strict=True, enum_values=True)
     MontyDecoder().process_decoded(d)
+
+
+def test_get_point_group_data():
+    _POINT_GROUP_CACHE.clear()
+    co2 = molecule("CO2")
+    assert _get_point_group_data(co2) == (True, 2)
+    assert len(_POINT_GROUP_CACHE) == 1
+    assert _get_point_group_data(co2.copy()) == (True, 2)
+    assert len(_POINT_GROUP_CACHE) == 1
+    assert _get_point_group_data(molecule("H2O")) == (False, 2)
+    assert len(_POINT_GROUP_CACHE) == 2
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from quacc.utils.cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    n_calls = 0
+
+    def _compute(value):
+        def _inner():
+            nonlocal n_calls
+            n_calls += 1
+            return value
+
+        return _inner
+
+    assert cache.get_or_compute("a", _compute(1)) == 1
+    assert cache.get_or_compute("a", _compute(2)) == 1
+    assert n_calls == 1
+
+    assert cache.get_or_compute("b", _compute(2)) == 2
+    cache.get_or_compute("a", _compute(1))
+    assert cache.get_or_compute("c", _compute(3)) == 3
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert n_calls == 3
+
+    cache.clear()
+    assert len(cache) == 0
@@ -3,6 +3,7 @@ from __future__ import annotations
 import gzip
 import os
 import time
+from datetime import datetime
 from logging import WARNING, getLogger
 from pathlib import Path
 
@@ -12,6 +13,8 @@ from quacc.utils.files import (
     check_logfile,
     copy_decompress_files,
     find_recent_logfile,
+    gzip_dir,
+    load_yaml_calc,
     make_unique_dir,
 )
 
@@ -31,6 +34,73 @@ def test_make_unique_dir(tmp_path, monkeypatch):
     assert os.path.exists(jobdir)
 
 
+def test_make_unique_dir_collision(tmp_path, monkeypatch):
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2024, 1, 1, tzinfo=tz)
+
+    suffixes = iter([11111, 11111, 22222])
+    monkeypatch.setattr("quacc.utils.files.datetime", FixedDatetime)
+    monkeypatch.setattr("quacc.utils.files.randint", lambda *_: next(suffixes))
+
+    jobdir1 = make_unique_dir(base_path=tmp_path)
+    jobdir2 = make_unique_dir(base_path=tmp_path)
+    assert jobdir1.name.endswith("-11111")
+    assert jobdir2.name.endswith("-22222")
+    assert jobdir1.is_dir()
+    assert jobdir2.is_dir()
+
+    n_attempts = 0
+
+    def _fixed_randint(*_):
+        nonlocal n_attempts
+        n_attempts += 1
+        return 11111
+
+    monkeypatch.setattr("quacc.utils.files.randint", _fixed_randint)
+    monkeypatch.setattr("quacc.utils.files._MAKE_UNIQUE_DIR_MAX_ATTEMPTS", 3)
+    with pytest.raises(FileExistsError):
+        make_unique_dir(base_path=tmp_path)
+    assert n_attempts == 3
+
+
+def test_gzip_dir(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ["file1", "file2", "sub/file3", "already.gz"]:
+        (tmp_path / name).write_text(name)
+    (tmp_path / "dup").write_text("dup")
+    (tmp_path / "dup.gz").write_text("dup")
+    (tmp_path / "CONTCAR").write_text("CONTCAR")
+    (tmp_path / "link").symlink_to(tmp_path / "CONTCAR")
+
+    with pytest.warns(UserWarning, match="Both dup and dup.gz exist"):
+        gzip_dir(tmp_path)
+
+    for name in ["file1", "file2", "sub/file3", "CONTCAR"]:
+        assert not (tmp_path / name).exists()
+        with gzip.open(tmp_path / f"{name}.gz", "rt") as f:
+            assert f.read() == name
+    assert (tmp_path / "already.gz").read_text() == "already.gz"
+    assert (tmp_path / "dup").exists()
+
+
+def test_load_yaml_calc_cached(tmp_path):
+    parent = tmp_path / "parent.yaml"
+    child = tmp_path / "child.yaml"
+    parent.write_text("inputs:\n  a: 1\n  b: 2\n")
+    child.write_text("parent: parent\ninputs:\n  b: 3\n")
+
+    config = load_yaml_calc(child)
+    assert config == {"inputs": {"a": 1, "b": 3}}
+
+    config["inputs"]["a"] = 100
+    assert load_yaml_calc(child) == {"inputs": {"a": 1, "b": 3}}
+
+    parent.write_text("inputs:\n  a: 10\n  b: 20\n  c: 30\n")
+    assert load_yaml_calc(child) == {"inputs": {"a": 10, "b": 3, "c": 30}}
+
+
 @pytest.mark.skipif(os.name == "nt", reason="Windows doesn't support symlinks")
 @pytest.mark.parametrize("files_to_copy", ["src", ["src"], "sr*"])
 def test_copy_decompress_files(tmp_path, files_to_copy):